@@ -7,46 +7,79 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple, Union
 
-from apps.level_editor.tileset_loader import TilesetData
+from apps.level_editor.tileset_loader import TilesetData, parse_categories
+
+try:
+    import ijson
+except ImportError:  # optional: only used to stream large metadata files
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional: faster parser for whole-file loads
+    orjson = None
 
 Metadata = Dict[str, dict]
 
+# Files at least this large are streamed tileset by tileset when ijson is installed
+STREAM_THRESHOLD_BYTES = 1 << 20
+
 
-def _expand_ids(id_entry) -> List[int]:
+def _expand_ids(id_entry) -> range:
     # Accept single ints or [start, end] inclusive ranges
     if isinstance(id_entry, int):
-        return [id_entry]
+        return range(id_entry, id_entry + 1)
     if isinstance(id_entry, list) and len(id_entry) == 2:
         start, end = id_entry
-        return list(range(int(start), int(end) + 1))
-    return []
+        return range(int(start), int(end) + 1)
+    return range(0)
 
 
 def load_metadata(path: Path) -> Metadata:
     if not path.exists():
         return {}
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
-def apply_metadata(cache: Dict[str, TilesetData], metadata: Metadata) -> None:
+def iter_metadata(path: Path) -> Iterator[Tuple[str, dict]]:
+    """Yields (tileset_name, meta) pairs so only one tileset's metadata has to be resident."""
+    if not path.exists():
+        return
+    if ijson is not None and path.stat().st_size >= STREAM_THRESHOLD_BYTES:
+        with path.open("rb") as f:
+            yield from ijson.kvitems(f, "", use_float=True)
+        return
+    yield from load_metadata(path).items()
+
+
+def apply_metadata(
+    cache: Dict[str, TilesetData], metadata: Union[Metadata, Iterable[Tuple[str, dict]]]
+) -> None:
     """Mutates the tileset cache, overlaying properties/categories from metadata."""
-    for tileset_name, meta in metadata.items():
+    entries = metadata.items() if isinstance(metadata, Mapping) else metadata
+    for tileset_name, meta in entries:
         if tileset_name not in cache:
             continue
         tileset = cache[tileset_name]
 
-        # Build category mapping per tile id
-        cats_by_id: Dict[int, Set[str]] = {}
-        for cat in meta.get("categories", []):
-            cat_name = cat.get("name")
-            if not cat_name:
-                continue
+        # Build category mapping per tile id. Categories are visited in name order so
+        # each list ends up sorted, with duplicates adjacent to each other.
+        cats_by_id: Dict[int, List[str]] = {}
+        named_cats = [cat for cat in meta.get("categories", []) if cat.get("name")]
+        for cat in sorted(named_cats, key=lambda c: c["name"]):
+            cat_name = cat["name"]
             for id_entry in cat.get("ids", []):
                 for tid in _expand_ids(id_entry):
-                    cats_by_id.setdefault(tid, set()).add(cat_name)
+                    names = cats_by_id.get(tid)
+                    if names is None:
+                        cats_by_id[tid] = [cat_name]
+                    elif names[-1] != cat_name:
+                        names.append(cat_name)
 
         # Build property mapping per tile id
         props_meta = meta.get("properties", {})
@@ -55,7 +88,13 @@ def apply_metadata(cache: Dict[str, TilesetData], metadata: Metadata) -> None:
         }
 
         for tile in tileset.tiles:
-            if tile.local_id in props_by_id:
-                tile.properties.update(props_by_id[tile.local_id])
-            if tile.local_id in cats_by_id:
-                tile.properties["category"] = ",".join(sorted(cats_by_id[tile.local_id]))
+            props = props_by_id.get(tile.local_id)
+            if props is not None:
+                tile.properties.update(props)
+            names = cats_by_id.get(tile.local_id)
+            if names is not None:
+                tile.properties["category"] = ",".join(names)
+            if props is not None or names is not None:
+                tile.categories = parse_categories(tile.properties.get("category", ""))
+        tileset.mark_tiles_changed()
+        tileset.refresh_categories()
@@ -22,7 +22,7 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from apps.level_editor.metadata import apply_metadata, load_metadata
+from apps.level_editor.metadata import apply_metadata, iter_metadata
 from apps.level_editor.palette_model import PaletteModel
 from apps.level_editor.palette_ui import PalettePanel
 from apps.level_editor.tileset_loader import discover_tilesets, load_tilesets
@@ -46,9 +46,8 @@ def main() -> None:
 
     # Apply optional editor metadata
     meta_path = Path("apps/level_editor/tileset_metadata.json")
-    metadata = load_metadata(meta_path)
-    if metadata:
-        apply_metadata(cache, metadata)
+    if meta_path.exists():
+        apply_metadata(cache, iter_metadata(meta_path))
         print(f"Applied metadata from {meta_path}")
     else:
         print(f"No metadata file found at {meta_path}; using raw TSX data")
@@ -61,12 +60,20 @@ def main() -> None:
     panel_rect = pygame.Rect(10, 30, 620, 560)
     panel = PalettePanel(model, panel_rect, on_tileset_menu=lambda: print("Tileset menu placeholder"))
 
+    font = pygame.font.SysFont(None, 18)
+    label_index = None
+    label_surface = None
+
     clock = pygame.time.Clock()
     running = True
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # The window contents were lost; the next frame repaints and flips everything
+                label_index = None
+                panel.invalidate()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_LEFTBRACKET:  # '[' cycles backward
                     tileset_index = (tileset_index - 1) % len(tileset_names)
@@ -75,16 +82,37 @@ def main() -> None:
                     tileset_index = (tileset_index + 1) % len(tileset_names)
                     model.set_tileset(tileset_names[tileset_index])
             panel.handle_event(event)
-
-        screen.fill((12, 12, 12))
-        panel.draw(screen)
-
-        # Draw current tileset label at top-left
-        label = f"Tileset: {tileset_names[tileset_index]}  ([/]=cycle, category buttons click, Esc=all)"
-        font = pygame.font.SysFont(None, 18)
-        text = font.render(label, True, (230, 230, 230))
-        screen.blit(text, (14, 6))
-        pygame.display.flip()
+        panel.update()
+
+        # Only repaint and push the regions that changed since the previous frame
+        first_frame = label_index is None
+        label_dirty = label_index != tileset_index
+        if not (label_dirty or panel.dirty):
+            clock.tick(60)
+            continue
+
+        changed_rects = []
+        if first_frame:
+            screen.fill((12, 12, 12))
+
+        # Draw current tileset label at top-left, re-rendering only when the tileset changes
+        if label_dirty:
+            label = f"Tileset: {tileset_names[tileset_index]}  ([/]=cycle, category buttons click, Esc=all)"
+            label_surface = font.render(label, True, (230, 230, 230))
+            label_index = tileset_index
+            header_rect = pygame.Rect(0, 0, screen.get_width(), panel_rect.y)
+            screen.fill((12, 12, 12), header_rect)
+            screen.blit(label_surface, (14, 6))
+            changed_rects.append(header_rect)
+
+        if panel.dirty:
+            panel.draw(screen)
+            changed_rects.append(panel.rect)
+
+        if first_frame:
+            pygame.display.flip()
+        else:
+            pygame.display.update(changed_rects)
         clock.tick(60)
 
     pygame.quit()
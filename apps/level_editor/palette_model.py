@@ -3,35 +3,154 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import pygame
 
 from apps.level_editor.tileset_loader import TileEntry, TilesetData
 
 FilterFn = Callable[[TileEntry], bool]
 
 
+@dataclass(frozen=True)
+class PropertySpec:
+    """Tiles having the property `key` (with exactly `value` unless it is None)."""
+
+    key: str
+    value: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CategorySpec:
+    """Tiles in any of the lower-cased `categories`."""
+
+    categories: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class AnimatedSpec:
+    """Tiles with an animation."""
+
+
+IndexedFilter = Union[PropertySpec, CategorySpec, AnimatedSpec]
+
+
 @dataclass
 class PaletteState:
     tileset_name: Optional[str] = None
     page_size: int = 25
     page_index: int = 0
     filter_fn: Optional[FilterFn] = None
+    indexed_filter: Optional[IndexedFilter] = None
+
+
+@dataclass
+class TilesetIndex:
+    """Positions into a tileset's tiles, grouped by what the palette filters on."""
+
+    with_prop: Dict[str, List[int]] = field(default_factory=dict)
+    by_prop: Dict[str, Dict[str, List[int]]] = field(default_factory=dict)
+    animated: List[int] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, tiles: List[TileEntry]) -> TilesetIndex:
+        index = cls()
+        for position, tile in enumerate(tiles):
+            for key, value in tile.properties.items():
+                index.with_prop.setdefault(key, []).append(position)
+                index.by_prop.setdefault(key, {}).setdefault(value, []).append(position)
+            if tile.is_animated:
+                index.animated.append(position)
+        return index
+
+    def lookup(self, spec: IndexedFilter) -> List[int]:
+        if isinstance(spec, AnimatedSpec):
+            return self.animated
+        if isinstance(spec, PropertySpec):
+            if spec.value is None:
+                return self.with_prop.get(spec.key, [])
+            return self.by_prop.get(spec.key, {}).get(spec.value, [])
+        # Categories are answered from TilesetData.category_masks, see PaletteModel.active_tiles
+        raise ValueError(f"TilesetIndex cannot answer {spec!r}")
 
 
 @dataclass
 class PaletteModel:
     tilesets: Dict[str, TilesetData]
     state: PaletteState = field(default_factory=PaletteState)
+    # Bumped whenever the tileset, filter or tileset revision changes; read through `version`
+    _version: int = field(default=0, init=False, repr=False)
+    # Revision of the current tileset that the cached tiles were derived from
+    _revision: int = field(default=0, init=False, repr=False)
+    _active_cache: Optional[List[TileEntry]] = field(default=None, init=False, repr=False)
+    # Page slice cached for the (page_index, page_size) it was computed with
+    _page_cache: Optional[Tuple[Tuple[int, int], List[TileEntry]]] = field(default=None, init=False, repr=False)
+    # (tileset_name, local_id) -> position on the cached page, built on demand
+    _page_positions: Optional[Dict[Tuple[str, int], int]] = field(default=None, init=False, repr=False)
+    # Scaled thumbnails per (tileset_name, size), keyed by local id; they outlive filter/page changes
+    _thumbs: Dict[Tuple[str, int], Dict[int, pygame.Surface]] = field(default_factory=dict, init=False, repr=False)
+    # Built on the first indexed filter applied to each tileset, with the tileset revision it reflects
+    _indices: Dict[str, Tuple[int, TilesetIndex]] = field(default_factory=dict, init=False, repr=False)
+
+    def _invalidate(self) -> None:
+        self._active_cache = None
+        self._page_cache = None
+        self._page_positions = None
+        self._version += 1
+
+    def _sync_revision(self) -> None:
+        """Drops derived caches once the current tileset was edited (e.g. by apply_metadata)."""
+        name = self.state.tileset_name
+        if name and self.tilesets[name].revision != self._revision:
+            self._revision = self.tilesets[name].revision
+            self._invalidate()
+
+    @property
+    def version(self) -> int:
+        """Changes whenever the tiles the model would show may have changed, so views can drop derived caches."""
+        self._sync_revision()
+        return self._version
 
     def set_tileset(self, name: str) -> None:
         if name not in self.tilesets:
             raise ValueError(f"Unknown tileset: {name}")
         self.state.tileset_name = name
         self.state.page_index = 0
+        self._revision = self.tilesets[name].revision
+        self._invalidate()
 
     def set_filter(self, predicate: Optional[FilterFn]) -> None:
         self.state.filter_fn = predicate
+        self.state.indexed_filter = None
+        self.state.page_index = 0
+        self._invalidate()
+
+    def set_filter_indexed(self, key: str, value: Optional[str] = None) -> None:
+        """Same result as set_filter(property_filter(key, value)), answered from the tileset index."""
+        self._set_indexed_filter(PropertySpec(key, value))
+
+    def set_category_filter(self, *categories: str) -> None:
+        """Keeps tiles in any of the categories; one category gives the same result as category_filter."""
+        self._set_indexed_filter(CategorySpec(tuple(category.lower() for category in categories)))
+
+    def set_animated_filter(self) -> None:
+        """Same result as set_filter(animated_filter()), answered from the tileset index."""
+        self._set_indexed_filter(AnimatedSpec())
+
+    def _set_indexed_filter(self, spec: IndexedFilter) -> None:
+        self.state.filter_fn = None
+        self.state.indexed_filter = spec
         self.state.page_index = 0
+        self._invalidate()
+
+    def _index(self, tileset_name: str) -> TilesetIndex:
+        tileset = self.tilesets[tileset_name]
+        cached = self._indices.get(tileset_name)
+        if cached is None or cached[0] != tileset.revision:
+            # Metadata edits tile properties in place; mark_tiles_changed() bumps the revision
+            cached = (tileset.revision, TilesetIndex.build(tileset.tiles))
+            self._indices[tileset_name] = cached
+        return cached[1]
 
     def set_page(self, index: int) -> None:
         self.state.page_index = max(0, min(index, self.page_count - 1))
@@ -40,22 +159,62 @@ class PaletteModel:
     def active_tiles(self) -> List[TileEntry]:
         if not self.state.tileset_name:
             return []
-        tiles = self.tilesets[self.state.tileset_name].tiles
-        if self.state.filter_fn:
-            tiles = [t for t in tiles if self.state.filter_fn(t)]
-        return tiles
+        self._sync_revision()
+        if self._active_cache is None:
+            tileset = self.tilesets[self.state.tileset_name]
+            tiles = tileset.tiles
+            spec = self.state.indexed_filter
+            if isinstance(spec, CategorySpec):
+                # Category membership is a bitmask per tile, so a match is a single AND
+                bits = tileset.category_bits
+                wanted = 0
+                for category in spec.categories:
+                    if category in bits:
+                        wanted |= 1 << bits[category]
+                tiles = [tile for tile, mask in zip(tiles, tileset.category_masks) if mask & wanted]
+            elif spec is not None:
+                positions = self._index(self.state.tileset_name).lookup(spec)
+                tiles = [tiles[position] for position in positions]
+            elif self.state.filter_fn:
+                tiles = [t for t in tiles if self.state.filter_fn(t)]
+            self._active_cache = tiles
+        return self._active_cache
 
     @property
     def page_count(self) -> int:
-        if not self.active_tiles:
-            return 0
         total = len(self.active_tiles)
         return (total + self.state.page_size - 1) // self.state.page_size
 
     def page_tiles(self) -> List[TileEntry]:
-        start = self.state.page_index * self.state.page_size
-        end = start + self.state.page_size
-        return self.active_tiles[start:end]
+        self._sync_revision()
+        key = (self.state.page_index, self.state.page_size)
+        if self._page_cache is None or self._page_cache[0] != key:
+            start = self.state.page_index * self.state.page_size
+            end = start + self.state.page_size
+            self._page_cache = (key, self.active_tiles[start:end])
+            self._page_positions = None
+        return self._page_cache[1]
+
+    def page_position(self, tileset_name: str, local_id: int) -> Optional[int]:
+        """Position of the tile on the current page, or None when it is not on it."""
+        tiles = self.page_tiles()
+        if self._page_positions is None:
+            self._page_positions = {(tile.tileset_name, tile.local_id): idx for idx, tile in enumerate(tiles)}
+        return self._page_positions.get((tileset_name, local_id))
+
+    def thumbnail(self, tile: TileEntry, size: int) -> pygame.Surface:
+        """Returns the tile scaled to size x size, scaling it only the first time it is requested."""
+        thumbs = self._thumbs.setdefault((tile.tileset_name, size), {})
+        thumb = thumbs.get(tile.local_id)
+        if thumb is None:
+            width, height = tile.surface.get_size()
+            if size % width == 0 and size % height == 0:
+                # Integer upscales of pixel art stay crisp and are cheaper without filtering
+                thumb = pygame.transform.scale(tile.surface, (size, size))
+            else:
+                thumb = pygame.transform.smoothscale(tile.surface, (size, size))
+            thumbs[tile.local_id] = thumb
+        return thumb
 
     def next_page(self) -> None:
         if self.state.page_index + 1 < self.page_count:
@@ -66,13 +225,15 @@ class PaletteModel:
             self.state.page_index -= 1
 
 
+_MISSING = object()
+
+
 def property_filter(key: str, value: Optional[str] = None) -> FilterFn:
     def _pred(tile: TileEntry) -> bool:
-        if key not in tile.properties:
-            return False
+        found = tile.properties.get(key, _MISSING)
         if value is None:
-            return True
-        return tile.properties.get(key) == value
+            return found is not _MISSING
+        return found == value
 
     return _pred
 
@@ -87,9 +248,4 @@ def animated_filter() -> FilterFn:
 
 def category_filter(category: str) -> FilterFn:
     category_lower = category.lower()
-
-    def _pred(tile: TileEntry) -> bool:
-        cat_value = tile.properties.get("category", "")
-        return any(part.strip().lower() == category_lower for part in cat_value.split(",")) if cat_value else False
-
-    return _pred
+    return lambda tile: category_lower in tile.categories
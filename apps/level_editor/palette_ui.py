@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import pygame
 
-from apps.level_editor.palette_model import PaletteModel, TileEntry, category_filter
+from apps.level_editor.palette_model import PaletteModel, TileEntry
+
+PAGE_LABEL_CACHE_SIZE = 32
+SELECTION_COLOR = (200, 200, 50)
+HOVER_COLOR = (150, 150, 150)
+
+
+def _outline_strips(rect: pygame.Rect, width: int) -> Tuple[pygame.Rect, ...]:
+    """Top, bottom, left and right strips covering the same pixels as draw.rect(..., width)."""
+    return (
+        pygame.Rect(rect.x, rect.y, rect.width, width),
+        pygame.Rect(rect.x, rect.bottom - width, rect.width, width),
+        pygame.Rect(rect.x, rect.y, width, rect.height),
+        pygame.Rect(rect.right - width, rect.y, width, rect.height),
+    )
 
 
 @dataclass
@@ -18,7 +33,7 @@ class DragPayload:
     stamp_mode: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PaletteUIConfig:
     tile_render_size: int = 48
     grid_cols: int = 10
@@ -33,13 +48,17 @@ class PaletteUIConfig:
     font_size: int = 14
 
 
+# Immutable, so a single instance can safely be shared by every panel
+DEFAULT_PALETTE_UI_CONFIG = PaletteUIConfig()
+
+
 class PalettePanel:
     def __init__(
         self,
         model: PaletteModel,
         rect: pygame.Rect,
         on_tileset_menu: Optional[Callable[[], None]] = None,
-        config: PaletteUIConfig = PaletteUIConfig(),
+        config: PaletteUIConfig = DEFAULT_PALETTE_UI_CONFIG,
     ) -> None:
         self.model = model
         self.rect = rect
@@ -50,10 +69,58 @@ class PalettePanel:
         self.model.state.page_size = self.config.grid_cols * self.config.grid_rows
 
         self.font = pygame.font.SysFont(self.config.font_name, self.config.font_size)
+        # Static text is rendered once; the tileset label only when the name changes
+        self._prev_glyph = self.font.render("<", True, self.config.text_color)
+        self._next_glyph = self.font.render(">", True, self.config.text_color)
+        self._collapsed_chevron = self.font.render("▾", True, self.config.text_color)
+        self._expanded_chevron = self.font.render("▴", True, self.config.text_color)
+        # Dropdown labels per filter key; category entries are added by _ensure_categories
+        self._filter_labels: Dict[str, pygame.Surface] = {"none": self.font.render("All", True, self.config.text_color)}
+        self._tileset_label: Optional[Tuple[str, pygame.Surface]] = None
+        # Paging labels keyed by (page_index, page_count), least recently used first
+        self._page_label_cache: "OrderedDict[Tuple[int, int], pygame.Surface]" = OrderedDict()
+        self._counts_label: Optional[Tuple[Tuple[int, int], pygame.Surface]] = None
+        # Fully composed tooltip boxes keyed by (tileset_name, local_id)
+        self._tooltip_cache: Dict[Tuple[str, int], pygame.Surface] = {}
+        self._tooltip_cache_version: int = self.model.version
         self.selected: Optional[TileEntry] = None
         self.hovered: Optional[int] = None
+        # Latest pointer position not yet hit-tested; see update()
+        self._pending_mouse_pos: Optional[Tuple[int, int]] = None
         self.drag_payload: Optional[DragPayload] = None
+        # Shift keys currently down, tracked from key events instead of polling SDL on each click
+        self._held_shift_keys: Set[int] = set()
 
+        # Filter buttons: None + dynamic categories from metadata
+        # Category dropdown
+        self._active_filter: str = "none"
+        self._categories: Tuple[str, ...] = ()
+        # "none" followed by the categories, rebuilt only when the categories change
+        self._dropdown_items: Tuple[str, ...] = ("none",)
+        self._dropdown_expanded: bool = False
+        self._dropdown_scroll: int = 0
+        self._max_visible_items: int = 10
+
+        # View state captured by the last draw(); None forces the first draw
+        self._drawn_state: Optional[tuple] = None
+        # State the static panel snapshot was rendered for; None forces a full repaint
+        self._snapshot_state: Optional[tuple] = None
+
+        self._relayout()
+
+    def set_rect(self, rect: pygame.Rect) -> None:
+        """Moves or resizes the panel, rebuilding every cached layout rect."""
+        self.rect = rect
+        self._relayout()
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forces the next draw() to repaint everything, e.g. after the window was exposed."""
+        self._drawn_state = None
+        self._snapshot_state = None
+
+    def _relayout(self) -> None:
+        """Recompute every rect derived from the panel rect and config."""
         # UI elements
         self._tileset_button = pygame.Rect(
             self.rect.x + self.config.padding,
@@ -61,20 +128,12 @@ class PalettePanel:
             self.rect.width - 2 * self.config.padding,
             24,
         )
-
-        # Filter buttons: None + dynamic categories from metadata
-        # Category dropdown
-        self._active_filter: str = "none"
-        self._categories: List[str] = []
         self._dropdown_rect = pygame.Rect(
             self.rect.x + self.config.padding,
             self.rect.y + self.config.padding + self._tileset_button.height + self.config.gutter,
             140,
             24,
         )
-        self._dropdown_expanded: bool = False
-        self._dropdown_scroll: int = 0
-        self._max_visible_items: int = 10
         self._prev_button = pygame.Rect(
             self.rect.x + self.config.padding,
             self.rect.bottom - self.config.padding - 24,
@@ -88,6 +147,56 @@ class PalettePanel:
             24,
         )
 
+        # Tileset bar + gutter + dropdown height + gutter
+        self._grid_origin_y = (
+            self.rect.y
+            + self.config.padding
+            + self._tileset_button.height
+            + self.config.gutter
+            + self._dropdown_rect.height
+            + self.config.gutter
+        )
+
+        # Cell geometry only depends on the layout, so build it here rather than per frame
+        tw = self.config.tile_render_size
+        stride = tw + self.config.gutter
+        origin_x = self.rect.x + self.config.padding
+        origin_y = self._grid_origin_y
+        self._cell_positions: List[Tuple[int, int]] = [
+            (origin_x + col * stride, origin_y + row * stride)
+            for row in range(self.config.grid_rows)
+            for col in range(self.config.grid_cols)
+        ]
+        self._cell_rects: List[pygame.Rect] = [pygame.Rect(x, y, tw, tw) for x, y in self._cell_positions]
+        # Highlight outlines are filled as strips, which is cheaper than drawing outlined rects
+        self._hover_outlines = [_outline_strips(cell, 1) for cell in self._cell_rects]
+        self._selection_outlines = [_outline_strips(cell, 2) for cell in self._cell_rects]
+
+        # Hit-test constants, so _tile_index_at does not go through the config on every mouse move
+        self._grid_origin = (origin_x, origin_y)
+        self._grid_stride = stride
+        self._grid_extent = (self.config.grid_cols * stride, self.config.grid_rows * stride)
+        self._build_chrome()
+
+        # Copy of everything that does not change with hover/selection, see draw()
+        self._panel_surf = pygame.Surface(self.rect.size)
+
+    def _build_chrome(self) -> None:
+        """Pre-render the panel background, boxes, empty cells and button glyphs into one surface."""
+        chrome = pygame.Surface(self.rect.size)
+        offset = (-self.rect.x, -self.rect.y)
+        bg, fill, border = self.config.bg_color, self.config.grid_color, self.config.border_color
+
+        chrome.fill(bg)
+        pygame.draw.rect(chrome, border, chrome.get_rect(), 1)
+        for box in (self._tileset_button, *self._cell_rects, self._prev_button, self._next_button, self._dropdown_rect):
+            box = box.move(offset)
+            pygame.draw.rect(chrome, fill, box)
+            pygame.draw.rect(chrome, border, box, 1)
+        for button, glyph in ((self._prev_button, self._prev_glyph), (self._next_button, self._next_glyph)):
+            chrome.blit(glyph, glyph.get_rect(center=button.move(offset).center))
+        self._chrome = chrome
+
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
@@ -115,7 +224,7 @@ class PalettePanel:
                     if tile_index < len(tiles):
                         tile = tiles[tile_index]
                         self.selected = tile
-                        stamp = bool(pygame.key.get_mods() & pygame.KMOD_SHIFT)
+                        stamp = bool(self._held_shift_keys)
                         self.drag_payload = DragPayload(
                             tileset_name=tile.tileset_name,
                             local_id=tile.local_id,
@@ -138,10 +247,20 @@ class PalettePanel:
                 self.drag_payload = None
 
         elif event.type == pygame.MOUSEMOTION:
-            self.hovered = self._tile_index_at(event.pos)
+            # High polling rate mice deliver many motions per frame; only the last one matters
+            self._pending_mouse_pos = event.pos
+
+        elif event.type == pygame.KEYUP:
+            self._held_shift_keys.discard(event.key)
+
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            # Key releases outside the window are never delivered
+            self._held_shift_keys.clear()
 
         elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_PAGEUP:
+            if event.key in (pygame.K_LSHIFT, pygame.K_RSHIFT):
+                self._held_shift_keys.add(event.key)
+            elif event.key == pygame.K_PAGEUP:
                 self.model.prev_page()
             elif event.key == pygame.K_PAGEDOWN:
                 self.model.next_page()
@@ -152,51 +271,81 @@ class PalettePanel:
             elif event.key == pygame.K_PERIOD:  # cycle categories forward
                 self._cycle_category(1)
 
+    def update(self) -> None:
+        """Applies input coalesced since the previous frame; call once per frame before draw()."""
+        if self._pending_mouse_pos is not None:
+            self.hovered = self._tile_index_at(self._pending_mouse_pos)
+            self._pending_mouse_pos = None
+
     def _tile_index_at(self, pos: Tuple[int, int]) -> Optional[int]:
-        grid_origin_y = self._grid_origin_y
-        grid_origin_x = self.rect.x + self.config.padding
+        dx = pos[0] - self._grid_origin[0]
+        dy = pos[1] - self._grid_origin[1]
+        width, height = self._grid_extent
+        if not (0 <= dx < width and 0 <= dy < height):
+            return None
+        stride = self._grid_stride
+        col, rx = divmod(dx, stride)
+        row, ry = divmod(dy, stride)
+        # Points in the gutter between cells do not hit any tile
         tw = self.config.tile_render_size
-        gh = self.config.gutter
-        for row in range(self.config.grid_rows):
-            for col in range(self.config.grid_cols):
-                idx = row * self.config.grid_cols + col
-                x = grid_origin_x + col * (tw + gh)
-                y = grid_origin_y + row * (tw + gh)
-                cell = pygame.Rect(x, y, tw, tw)
-                if cell.collidepoint(pos):
-                    return idx
-        return None
+        if rx >= tw or ry >= tw:
+            return None
+        return row * self.config.grid_cols + col
+
+    def _view_state(self) -> tuple:
+        selected_key = (self.selected.tileset_name, self.selected.local_id) if self.selected else None
+        return (
+            self.model.version,
+            self.model.state.tileset_name,
+            self.model.state.page_index,
+            self.hovered,
+            selected_key,
+            self._active_filter,
+            self._dropdown_expanded,
+            self._dropdown_scroll,
+        )
 
     @property
-    def _grid_origin_y(self) -> int:
-        # Tileset bar + gutter + dropdown height + gutter
-        fb_height = self._dropdown_rect.height
+    def dirty(self) -> bool:
+        """Whether the panel would look different from what the last draw() produced."""
+        return self._drawn_state != self._view_state()
+
+    def _static_state(self) -> tuple:
         return (
-            self.rect.y
-            + self.config.padding
-            + self._tileset_button.height
-            + self.config.gutter
-            + fb_height
-            + self.config.gutter
+            self.model.version,
+            self.model.state.tileset_name,
+            self.model.state.page_index,
+            self._dropdown_items,
+            self._active_filter,
+            self._dropdown_expanded,
         )
 
     def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.rect(surface, self.config.bg_color, self.rect)
-        pygame.draw.rect(surface, self.config.border_color, self.rect, 1)
-
-        self._draw_tileset_bar(surface)
         self._ensure_categories()
-        self._draw_grid(surface)
-        self._draw_paging(surface)
-        # Draw dropdown after grid/paging so the expanded list overlays tiles
-        self._draw_dropdown(surface)
+        static_state = self._static_state()
+        if static_state != self._snapshot_state:
+            surface.blit(self._chrome, self.rect.topleft)
+            self._draw_tileset_bar(surface)
+            self._draw_grid(surface)
+            self._draw_paging(surface)
+            self._draw_dropdown_header(surface)
+            # Keep the static layers so later frames only need a single blit
+            self._panel_surf.blit(surface, (0, 0), self.rect)
+            self._snapshot_state = static_state
+        else:
+            surface.blit(self._panel_surf, self.rect.topleft)
+
+        self._draw_highlights(surface)
+        # Draw dropdown list after grid/paging so the expanded list overlays tiles
+        self._draw_dropdown_list(surface)
         self._draw_tooltip(surface)
+        self._drawn_state = self._view_state()
 
     def _draw_tileset_bar(self, surface: pygame.Surface) -> None:
-        pygame.draw.rect(surface, self.config.grid_color, self._tileset_button)
-        pygame.draw.rect(surface, self.config.border_color, self._tileset_button, 1)
         name = self.model.state.tileset_name or "Select tileset"
-        text = self.font.render(name, True, self.config.text_color)
+        if self._tileset_label is None or self._tileset_label[0] != name:
+            self._tileset_label = (name, self.font.render(name, True, self.config.text_color))
+        text = self._tileset_label[1]
         surface.blit(
             text,
             (
@@ -205,12 +354,8 @@ class PalettePanel:
             ),
         )
 
-    def _draw_dropdown(self, surface: pygame.Surface) -> None:
-        # Header
-        pygame.draw.rect(surface, self.config.grid_color, self._dropdown_rect)
-        pygame.draw.rect(surface, self.config.border_color, self._dropdown_rect, 1)
-        label = "All" if self._active_filter == "none" else self._active_filter.capitalize()
-        text = self.font.render(label, True, self.config.text_color)
+    def _draw_dropdown_header(self, surface: pygame.Surface) -> None:
+        text = self._filter_labels[self._active_filter]
         surface.blit(
             text,
             (
@@ -219,8 +364,7 @@ class PalettePanel:
             ),
         )
         # Chevron
-        chevron = "▾" if not self._dropdown_expanded else "▴"
-        ch = self.font.render(chevron, True, self.config.text_color)
+        ch = self._collapsed_chevron if not self._dropdown_expanded else self._expanded_chevron
         surface.blit(
             ch,
             (
@@ -229,10 +373,11 @@ class PalettePanel:
             ),
         )
 
+    def _draw_dropdown_list(self, surface: pygame.Surface) -> None:
         if not self._dropdown_expanded:
             return
 
-        items = ["none"] + self._categories
+        items = self._dropdown_items
         visible = items[self._dropdown_scroll : self._dropdown_scroll + self._max_visible_items]
         item_height = self._dropdown_rect.height
         list_height = item_height * len(visible)
@@ -255,7 +400,7 @@ class PalettePanel:
             active = key == self._active_filter
             if active:
                 pygame.draw.rect(surface, (70, 70, 90), row_rect)
-            text = self.font.render("All" if key == "none" else key.capitalize(), True, self.config.text_color)
+            text = self._filter_labels[key]
             surface.blit(
                 text,
                 (
@@ -267,27 +412,23 @@ class PalettePanel:
     def _draw_grid(self, surface: pygame.Surface) -> None:
         tiles = self.model.page_tiles()
         tw = self.config.tile_render_size
-        gh = self.config.gutter
-        origin_x = self.rect.x + self.config.padding
-        origin_y = self._grid_origin_y
 
-        for idx in range(self.config.grid_rows * self.config.grid_cols):
-            col = idx % self.config.grid_cols
-            row = idx // self.config.grid_cols
-            x = origin_x + col * (tw + gh)
-            y = origin_y + row * (tw + gh)
-            cell = pygame.Rect(x, y, tw, tw)
-            pygame.draw.rect(surface, self.config.grid_color, cell)
-            pygame.draw.rect(surface, self.config.border_color, cell, 1)
-
-            if idx < len(tiles):
-                tile = tiles[idx]
-                tile_img = pygame.transform.smoothscale(tile.surface, (tw, tw))
-                surface.blit(tile_img, (x, y))
-                if self.selected and tile.local_id == self.selected.local_id and tile.tileset_name == self.selected.tileset_name:
-                    pygame.draw.rect(surface, (200, 200, 50), cell, 2)
-                elif self.hovered == idx:
-                    pygame.draw.rect(surface, (150, 150, 150), cell, 1)
+        for idx, tile in enumerate(tiles[: len(self._cell_rects)]):
+            tile_img = self.model.thumbnail(tile, tw)
+            surface.blit(tile_img, self._cell_positions[idx])
+
+    def _draw_highlights(self, surface: pygame.Surface) -> None:
+        cell_count = min(len(self.model.page_tiles()), len(self._cell_rects))
+        # Looked up by key instead of comparing every tile on the page against the selection
+        selected_idx = None
+        if self.selected is not None:
+            selected_idx = self.model.page_position(self.selected.tileset_name, self.selected.local_id)
+        if selected_idx is not None and selected_idx < cell_count:
+            for strip in self._selection_outlines[selected_idx]:
+                surface.fill(SELECTION_COLOR, strip)
+        if self.hovered is not None and self.hovered != selected_idx and self.hovered < cell_count:
+            for strip in self._hover_outlines[self.hovered]:
+                surface.fill(HOVER_COLOR, strip)
 
     def _draw_tooltip(self, surface: pygame.Surface) -> None:
         if self.hovered is None:
@@ -296,6 +437,25 @@ class PalettePanel:
         if self.hovered >= len(tiles):
             return
         tile = tiles[self.hovered]
+        if self._tooltip_cache_version != self.model.version:
+            # version also moves when the tileset's revision does (apply_metadata), so edited
+            # properties are never shown from a stale tooltip
+            self._tooltip_cache.clear()
+            self._tooltip_cache_version = self.model.version
+        key = (tile.tileset_name, tile.local_id)
+        box = self._tooltip_cache.get(key)
+        if box is None:
+            box = self._compose_tooltip(tile)
+            self._tooltip_cache[key] = box
+        surface.blit(
+            box,
+            (
+                self.rect.right - box.get_width() - self.config.padding,
+                self.rect.bottom - box.get_height() - self.config.padding,
+            ),
+        )
+
+    def _compose_tooltip(self, tile: TileEntry) -> pygame.Surface:
         lines = [f"ID: {tile.local_id}"]
         if tile.properties:
             lines += [f"{k}: {v}" for k, v in tile.properties.items()]
@@ -307,41 +467,17 @@ class PalettePanel:
         text_surfs = [font.render(l, True, self.config.text_color) for l in lines]
         width = max(ts.get_width() for ts in text_surfs) + 2 * padding
         height = sum(ts.get_height() for ts in text_surfs) + 2 * padding
-        x = self.rect.right - width - self.config.padding
-        y = self.rect.bottom - height - self.config.padding
-        box = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(surface, (25, 25, 25), box)
-        pygame.draw.rect(surface, self.config.border_color, box, 1)
-        cy = y + padding
+        box = pygame.Surface((width, height))
+        box.fill((25, 25, 25))
+        pygame.draw.rect(box, self.config.border_color, box.get_rect(), 1)
+        cy = padding
         for ts in text_surfs:
-            surface.blit(ts, (x + padding, cy))
+            box.blit(ts, (padding, cy))
             cy += ts.get_height()
+        return box
 
     def _draw_paging(self, surface: pygame.Surface) -> None:
-        pygame.draw.rect(surface, self.config.grid_color, self._prev_button)
-        pygame.draw.rect(surface, self.config.border_color, self._prev_button, 1)
-        prev_text = self.font.render("<", True, self.config.text_color)
-        surface.blit(
-            prev_text,
-            (
-                self._prev_button.centerx - prev_text.get_width() // 2,
-                self._prev_button.centery - prev_text.get_height() // 2,
-            ),
-        )
-
-        pygame.draw.rect(surface, self.config.grid_color, self._next_button)
-        pygame.draw.rect(surface, self.config.border_color, self._next_button, 1)
-        next_text = self.font.render(">", True, self.config.text_color)
-        surface.blit(
-            next_text,
-            (
-                self._next_button.centerx - next_text.get_width() // 2,
-                self._next_button.centery - next_text.get_height() // 2,
-            ),
-        )
-
-        page_label = f"{self.model.state.page_index + 1}/{max(1, self.model.page_count)}"
-        label_surf = self.font.render(page_label, True, self.config.text_color)
+        label_surf = self._page_label(self.model.state.page_index, max(1, self.model.page_count))
         surface.blit(
             label_surf,
             (
@@ -356,8 +492,9 @@ class PalettePanel:
         if self.model.state.tileset_name:
             total = len(self.model.tilesets[self.model.state.tileset_name].tiles)
             filtered = len(self.model.active_tiles)
-        counts_label = f"{filtered}/{total}"
-        counts_surf = self.font.render(counts_label, True, self.config.text_color)
+        if self._counts_label is None or self._counts_label[0] != (filtered, total):
+            self._counts_label = ((filtered, total), self.font.render(f"{filtered}/{total}", True, self.config.text_color))
+        counts_surf = self._counts_label[1]
         surface.blit(
             counts_surf,
             (
@@ -366,11 +503,23 @@ class PalettePanel:
             ),
         )
 
+    def _page_label(self, page_index: int, page_count: int) -> pygame.Surface:
+        key = (page_index, page_count)
+        label_surf = self._page_label_cache.get(key)
+        if label_surf is not None:
+            self._page_label_cache.move_to_end(key)
+            return label_surf
+        label_surf = self.font.render(f"{page_index + 1}/{page_count}", True, self.config.text_color)
+        self._page_label_cache[key] = label_surf
+        if len(self._page_label_cache) > PAGE_LABEL_CACHE_SIZE:
+            self._page_label_cache.popitem(last=False)
+        return label_surf
+
     def _apply_filter(self, key: str) -> None:
         if key == "none":
             self.model.set_filter(None)
         elif key in self._categories:
-            self.model.set_filter(category_filter(key))
+            self.model.set_category_filter(key)
         else:
             return
         self._active_filter = key
@@ -382,30 +531,23 @@ class PalettePanel:
         tileset_name = self.model.state.tileset_name
         if not tileset_name:
             return
-        tiles = self.model.tilesets[tileset_name].tiles
-        categories: List[str] = []
-        seen = set()
-        for tile in tiles:
-            cat_val = tile.properties.get("category")
-            if not cat_val:
-                continue
-            for part in cat_val.split(","):
-                cat = part.strip()
-                if cat and cat not in seen:
-                    seen.add(cat)
-                    categories.append(cat)
-        categories.sort()
-        if categories == self._categories:
+        # Computed once per tileset load/metadata pass; a new tuple means the categories changed
+        categories = self.model.tilesets[tileset_name].categories
+        if categories is self._categories:
             return
         self._categories = categories
-        if self._active_filter not in ("none", *categories):
+        self._dropdown_items = ("none", *categories)
+        for cat in categories:
+            if cat not in self._filter_labels:
+                self._filter_labels[cat] = self.font.render(cat.capitalize(), True, self.config.text_color)
+        if self._active_filter not in self._dropdown_items:
             self._active_filter = "none"
         self._dropdown_scroll = 0
 
     def _dropdown_item_at(self, pos: Tuple[int, int]) -> Optional[str]:
         if not self._dropdown_expanded:
             return None
-        items = ["none"] + self._categories
+        items = self._dropdown_items
         visible = items[self._dropdown_scroll : self._dropdown_scroll + self._max_visible_items]
         item_height = self._dropdown_rect.height
         list_rect = pygame.Rect(
@@ -423,12 +565,12 @@ class PalettePanel:
         return None
 
     def _scroll_dropdown(self, delta: int) -> None:
-        items = ["none"] + self._categories
+        items = self._dropdown_items
         max_start = max(0, len(items) - self._max_visible_items)
         self._dropdown_scroll = min(max(0, self._dropdown_scroll + delta), max_start)
 
     def _cycle_category(self, delta: int) -> None:
-        items = ["none"] + self._categories
+        items = self._dropdown_items
         if not items:
             return
         try:
@@ -6,10 +6,12 @@ per-tile surfaces and properties for fast palette access.
 
 from __future__ import annotations
 
+import os
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 import pygame
 
@@ -31,21 +33,86 @@ class TilesetInfo:
 class TileEntry:
     tileset_name: str
     local_id: int
-    surface: pygame.Surface
     properties: Dict[str, str]
     is_animated: bool = False
+    # Lower-cased names from the comma separated "category" property
+    categories: FrozenSet[str] = frozenset()
+    # Ready-made surface (collection tiles); atlas tiles only keep their atlas rect until first drawn
+    image: Optional[pygame.Surface] = field(default=None, repr=False)
+    atlas: Optional[pygame.Surface] = field(default=None, repr=False)
+    atlas_rect: Optional[Tuple[int, int, int, int]] = None
+
+    def __post_init__(self) -> None:
+        if self.image is None and (self.atlas is None or self.atlas_rect is None):
+            raise ValueError(
+                f"Tile {self.tileset_name}:{self.local_id} needs either image or both atlas and atlas_rect"
+            )
+
+    @property
+    def surface(self) -> pygame.Surface:
+        if self.image is None:
+            self.image = _cut_tile(self.atlas, pygame.Rect(self.atlas_rect))
+        return self.image
 
 
 @dataclass
 class TilesetData:
     info: TilesetInfo
     tiles: List[TileEntry]
+    # Atlas image that tile surfaces are subsurfaces of (None for collection tilesets)
+    atlas: Optional[pygame.Surface] = None
+    # Sorted distinct names from the tiles' "category" properties, as displayed in the palette.
+    # Replaced (never mutated) by refresh_categories, so views can detect changes by identity.
+    categories: Tuple[str, ...] = field(init=False, default=())
+    # Bit position of each lower-cased category, and per tile (same order as tiles) the OR of its bits
+    category_bits: Dict[str, int] = field(init=False, default_factory=dict)
+    category_masks: List[int] = field(init=False, default_factory=list)
+    # Bumped by mark_tiles_changed so views can drop anything derived from the tiles
+    revision: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.refresh_categories()
+
+    def mark_tiles_changed(self) -> None:
+        """Call after editing tiles in place (properties, is_animated, categories) so cached views refresh."""
+        self.revision += 1
+
+    def refresh_categories(self) -> None:
+        """Recomputes the category list and masks; call after editing tile categories."""
+        self.mark_tiles_changed()
+        bits: Dict[str, int] = {}
+        masks: List[int] = []
+        for tile in self.tiles:
+            mask = 0
+            for cat in tile.categories:
+                bit = bits.get(cat)
+                if bit is None:
+                    bit = bits[cat] = len(bits)
+                mask |= 1 << bit
+            masks.append(mask)
+        self.category_bits = bits
+        self.category_masks = masks
+
+        seen = set()
+        for tile in self.tiles:
+            cat_val = tile.properties.get("category")
+            if not cat_val:
+                continue
+            for part in cat_val.split(","):
+                cat = part.strip()
+                if cat:
+                    seen.add(cat)
+        self.categories = tuple(sorted(seen))
 
 
 class TilesetLoadError(Exception):
     pass
 
 
+def parse_categories(value: str) -> FrozenSet[str]:
+    return frozenset(part.strip().lower() for part in value.split(",") if part.strip())
+
+
 def _parse_properties(node: ET.Element) -> Dict[str, str]:
     props: Dict[str, str] = {}
     props_node = node.find("properties")
@@ -59,12 +126,49 @@ def _parse_properties(node: ET.Element) -> Dict[str, str]:
     return props
 
 
-def _load_tileset_xml(tsx_path: Path) -> ET.Element:
+def _parse_tileset_xml(
+    tsx_path: Path,
+) -> Tuple[ET.Element, Dict[int, Dict[str, str]], Dict[int, bool], Dict[int, str]]:
+    """Single pass over the TSX, returning the root plus per-tile properties, animations and image sources.
+
+    <tile> elements are cleared once read, so large tilesets do not keep their subtrees alive.
+    """
+    tile_props: Dict[int, Dict[str, str]] = {}
+    animations: Dict[int, bool] = {}
+    tile_images: Dict[int, str] = {}
+    root: Optional[ET.Element] = None
     try:
-        tree = ET.parse(tsx_path)
+        for _, elem in ET.iterparse(str(tsx_path), events=("end",)):
+            root = elem
+            if elem.tag != "tile":
+                continue
+            tid = int(elem.attrib.get("id", -1))
+            if tid >= 0:
+                props = _parse_properties(elem)
+                tile_type = elem.attrib.get("type")
+                if tile_type:
+                    props.setdefault("type", tile_type)
+                tile_props[tid] = props
+                if elem.find("animation") is not None:
+                    animations[tid] = True
+                image_node = elem.find("image")
+                if image_node is not None and image_node.attrib.get("source"):
+                    tile_images[tid] = image_node.attrib["source"]
+            elem.clear()
     except ET.ParseError as exc:
         raise TilesetLoadError(f"Invalid TSX XML: {tsx_path}") from exc
-    return tree.getroot()
+    # The document element is the last one to end
+    return root, tile_props, animations, tile_images
+
+
+def _cut_tile(atlas: pygame.Surface, tile_rect: pygame.Rect) -> pygame.Surface:
+    if atlas.get_rect().contains(tile_rect):
+        # Zero-copy view into the atlas; shares its display-converted pixel format
+        return atlas.subsurface(tile_rect)
+    # Tiles hanging off the atlas edge get a padded copy
+    surface = pygame.Surface(tile_rect.size, pygame.SRCALPHA, atlas)
+    surface.blit(atlas, (0, 0), tile_rect)
+    return surface
 
 
 def _slice_tiles(
@@ -77,67 +181,106 @@ def _slice_tiles(
     tw, th = tileset_info.tile_width, tileset_info.tile_height
     margin, spacing = tileset_info.margin, tileset_info.spacing
     cols = max(1, tileset_info.columns)
+    # Tile origins form a lattice, so compute each column/row offset once
+    xs = [margin + col * (tw + spacing) for col in range(cols)]
+    ys = [margin + row * (th + spacing) for row in range((tileset_info.tile_count + cols - 1) // cols)]
 
     for local_id in range(tileset_info.tile_count):
-        col = local_id % cols
-        row = local_id // cols
-        x = margin + col * (tw + spacing)
-        y = margin + row * (th + spacing)
-        surface = pygame.Surface((tw, th), pygame.SRCALPHA)
-        surface.blit(image, (0, 0), (x, y, tw, th))
-        entry = TileEntry(
-            tileset_name=tileset_info.name,
-            local_id=local_id,
-            surface=surface,
-            properties=tile_props.get(local_id, {}),
-            is_animated=animations.get(local_id, False),
-        )
+        row, col = divmod(local_id, cols)
+        # Surfaces are cut on first use, so tiles never shown cost no surface at all
+        tile_rect = (xs[col], ys[row], tw, th)
+        props = tile_props.get(local_id)
+        if props is None:
+            # Most atlas tiles carry no TSX data; skip the property and category parsing for them
+            entry = TileEntry(
+                tileset_name=tileset_info.name, local_id=local_id, properties={}, atlas=image, atlas_rect=tile_rect
+            )
+        else:
+            entry = TileEntry(
+                tileset_name=tileset_info.name,
+                local_id=local_id,
+                properties=props,
+                is_animated=animations.get(local_id, False),
+                categories=parse_categories(props.get("category", "")),
+                atlas=image,
+                atlas_rect=tile_rect,
+            )
         tiles.append(entry)
     return tiles
 
 
+@dataclass
+class _DecodedTileset:
+    """Thread-safe half of a tileset load: parsed TSX plus raw, unconverted images."""
+
+    tsx_path: Path
+    root: ET.Element
+    tile_props: Dict[int, Dict[str, str]]
+    animations: Dict[int, bool]
+    image_path: Optional[Path] = None
+    image: Optional[pygame.Surface] = None
+    # Collection tilesets: per-tile images keyed by local id
+    tile_images: Dict[int, pygame.Surface] = field(default_factory=dict)
+
+
+def _load_image(image_path: Path, what: str) -> pygame.Surface:
+    if not image_path.exists():
+        raise TilesetLoadError(f"{what} not found: {image_path}")
+    try:
+        return pygame.image.load(str(image_path))
+    except pygame.error as exc:
+        raise TilesetLoadError(f"Failed to load {what.lower()}: {image_path}") from exc
+
+
+def _decode_tileset(tsx_path: Path) -> _DecodedTileset:
+    """Parses the TSX and decodes its images; safe to run off the main thread."""
+    root, tile_props, animations, tile_sources = _parse_tileset_xml(tsx_path)
+    decoded = _DecodedTileset(tsx_path=tsx_path, root=root, tile_props=tile_props, animations=animations)
+
+    image_node = root.find("image")
+    if image_node is not None:
+        image_source = image_node.attrib.get("source")
+        if not image_source:
+            raise TilesetLoadError(f"Tileset image source missing: {tsx_path}")
+        decoded.image_path = (tsx_path.parent / image_source).resolve()
+        decoded.image = _load_image(decoded.image_path, "Tileset image")
+        return decoded
+
+    # Collection tileset (tiles reference their own images)
+    for tid, source in tile_sources.items():
+        decoded.tile_images[tid] = _load_image((tsx_path.parent / source).resolve(), "Tile image")
+    return decoded
+
+
 def _load_collection_tiles(
-    root: ET.Element,
-    tsx_path: Path,
+    name: str,
     tile_width: int,
     tile_height: int,
+    tile_images: Dict[int, pygame.Surface],
     tile_props: Dict[int, Dict[str, str]],
     animations: Dict[int, bool],
 ) -> List[TileEntry]:
     tiles: List[TileEntry] = []
-    for tile_node in root.findall("tile"):
-        tid = int(tile_node.attrib.get("id", -1))
-        image_node = tile_node.find("image")
-        if tid < 0 or image_node is None:
-            continue
-        source = image_node.attrib.get("source")
-        if not source:
-            continue
-        image_path = (tsx_path.parent / source).resolve()
-        if not image_path.exists():
-            raise TilesetLoadError(f"Tile image not found: {image_path}")
-        try:
-            image_surface = pygame.image.load(str(image_path)).convert_alpha()
-        except pygame.error as exc:
-            raise TilesetLoadError(f"Failed to load tile image: {image_path}") from exc
-
-        surface = pygame.transform.smoothscale(image_surface, (tile_width, tile_height))
+    for tid, image_surface in tile_images.items():
+        surface = pygame.transform.smoothscale(image_surface.convert_alpha(), (tile_width, tile_height))
+        props = tile_props.get(tid, {})
         tiles.append(
             TileEntry(
-                tileset_name=root.attrib.get("name", tsx_path.stem),
+                tileset_name=name,
                 local_id=tid,
-                surface=surface,
-                properties=tile_props.get(tid, {}),
+                properties=props,
                 is_animated=animations.get(tid, False),
+                categories=parse_categories(props.get("category", "")),
+                image=surface,
             )
         )
     return sorted(tiles, key=lambda t: t.local_id)
 
 
-def load_tileset(tsx_path: Path, base_dir: Optional[Path] = None) -> TilesetData:
-    tsx_path = tsx_path.resolve()
-    base_dir = base_dir or tsx_path.parent
-    root = _load_tileset_xml(tsx_path)
+def _finalize_tileset(decoded: _DecodedTileset) -> TilesetData:
+    """Converts and slices the decoded images; needs the display, so main thread only."""
+    root, tsx_path = decoded.root, decoded.tsx_path
+    tile_props, animations = decoded.tile_props, decoded.animations
 
     name = root.attrib.get("name", tsx_path.stem)
     tile_width = int(root.attrib["tilewidth"])
@@ -147,34 +290,8 @@ def load_tileset(tsx_path: Path, base_dir: Optional[Path] = None) -> TilesetData
     margin = int(root.attrib.get("margin", 0))
     spacing = int(root.attrib.get("spacing", 0))
 
-    tile_props: Dict[int, Dict[str, str]] = {}
-    animations: Dict[int, bool] = {}
-    for tile_node in root.findall("tile"):
-        tid = int(tile_node.attrib.get("id", -1))
-        if tid < 0:
-            continue
-        props = _parse_properties(tile_node)
-        tile_type = tile_node.attrib.get("type")
-        if tile_type:
-            props.setdefault("type", tile_type)
-        tile_props[tid] = props
-        if tile_node.find("animation") is not None:
-            animations[tid] = True
-
-    image_node = root.find("image")
-    if image_node is not None:
-        image_source = image_node.attrib.get("source")
-        if not image_source:
-            raise TilesetLoadError(f"Tileset image source missing: {tsx_path}")
-        image_path = (tsx_path.parent / image_source).resolve()
-
-        if not image_path.exists():
-            raise TilesetLoadError(f"Tileset image not found: {image_path}")
-
-        try:
-            image_surface = pygame.image.load(str(image_path)).convert_alpha()
-        except pygame.error as exc:
-            raise TilesetLoadError(f"Failed to load tileset image: {image_path}") from exc
+    if decoded.image is not None:
+        image_surface = decoded.image.convert_alpha()
 
         if tile_count == 0:
             # Derive tile count from image if not specified
@@ -185,7 +302,7 @@ def load_tileset(tsx_path: Path, base_dir: Optional[Path] = None) -> TilesetData
         info = TilesetInfo(
             name=name,
             path=tsx_path,
-            image_path=image_path,
+            image_path=decoded.image_path,
             tile_width=tile_width,
             tile_height=tile_height,
             margin=margin,
@@ -195,10 +312,9 @@ def load_tileset(tsx_path: Path, base_dir: Optional[Path] = None) -> TilesetData
         )
 
         tiles = _slice_tiles(info, image_surface, tile_props, animations)
-        return TilesetData(info=info, tiles=tiles)
+        return TilesetData(info=info, tiles=tiles, atlas=image_surface)
 
-    # Collection tileset (tiles reference their own images)
-    tiles = _load_collection_tiles(root, tsx_path, tile_width, tile_height, tile_props, animations)
+    tiles = _load_collection_tiles(name, tile_width, tile_height, decoded.tile_images, tile_props, animations)
     if not tiles:
         raise TilesetLoadError(f"Tileset missing <image> and no tile images found: {tsx_path}")
 
@@ -216,11 +332,24 @@ def load_tileset(tsx_path: Path, base_dir: Optional[Path] = None) -> TilesetData
     return TilesetData(info=info, tiles=tiles)
 
 
+def load_tileset(tsx_path: Path, base_dir: Optional[Path] = None) -> TilesetData:
+    tsx_path = tsx_path.resolve()
+    base_dir = base_dir or tsx_path.parent
+    return _finalize_tileset(_decode_tileset(tsx_path))
+
+
 def load_tilesets(tsx_paths: List[Path]) -> Dict[str, TilesetData]:
     cache: Dict[str, TilesetData] = {}
-    for tsx_path in tsx_paths:
-        data = load_tileset(tsx_path)
-        cache[data.info.name] = data
+    if not tsx_paths:
+        return cache
+    # XML parsing and image decoding run on worker threads (decoding releases the GIL);
+    # convert_alpha() and slicing need the display, so they stay on the calling thread.
+    # map() keeps input order.
+    resolved = [path.resolve() for path in tsx_paths]
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(resolved))) as executor:
+        for decoded in executor.map(_decode_tileset, resolved):
+            data = _finalize_tileset(decoded)
+            cache[data.info.name] = data
     return cache
 
 
@@ -1,13 +1,15 @@
 """Minimal TMX round-trip helper for editor experiments.
 
-Reads a TMX, applies an optional property edit, writes it back, and re-loads
-with pytmx to ensure the file stays compatible with the game loader.
+Reads a TMX, applies an optional property edit, writes it back, and can
+re-load it with pytmx to ensure the file stays compatible with the game loader.
 
 Usage examples (run from repo root):
     uv run python apps/level_editor/tmx_roundtrip.py --input maps/level_0/map.tmx --output tmp/map_copy.tmx
 
     uv run python apps/level_editor/tmx_roundtrip.py --input maps/level_0/map.tmx --set-property example_key example_value
 
+    uv run python apps/level_editor/tmx_roundtrip.py --input maps/level_0/map.tmx --output tmp/map_copy.tmx --validate
+
 Swap `uv run python` for your interpreter if you are not using uv.
 """
 
@@ -42,6 +44,7 @@ def round_trip(
     input_path: Path,
     output_path: Optional[Path] = None,
     transform: Optional[Callable[[ET.Element], None]] = None,
+    validate: bool = False,
 ) -> Path:
     # Preserve tileset-relative paths by defaulting relative outputs next to the input TMX.
     if output_path and not output_path.is_absolute():
@@ -54,10 +57,12 @@ def round_trip(
         transform(root)
 
     output = output_path or input_path
-    tree.write(output, encoding="utf-8", xml_declaration=True)
+    with open(output, "wb", buffering=1 << 20) as file:
+        tree.write(file, encoding="utf-8", xml_declaration=True, short_empty_elements=True)
 
-    # Validate the written file still loads.
-    pytmx.TiledMap(str(output))
+    if validate:
+        # Full second parse, only on request: check the written file still loads.
+        pytmx.TiledMap(str(output))
     return output
 
 
@@ -73,6 +78,11 @@ def main() -> None:
         metavar=("KEY", "VALUE"),
         help="Set or update a map-level property before writing",
     )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Re-load the written TMX with pytmx to check it stays loadable",
+    )
 
     args = parser.parse_args()
 
@@ -81,7 +91,9 @@ def main() -> None:
             key, value = args.set_property
             set_property(root, key, value)
 
-    output = round_trip(args.input, args.output, transform if args.set_property else None)
+    output = round_trip(
+        args.input, args.output, transform if args.set_property else None, validate=args.validate
+    )
     print(f"Wrote TMX to {output}")
 
 
@@ -8,12 +8,19 @@ names to fully built ``Skill`` instances via ``get_skill_data``.
 
 from __future__ import annotations
 
+import functools
 import json
+from pathlib import Path
 from typing import NotRequired, TypedDict
 
 from src.game_entities.skill import Skill
 from .load_from_xml_manager import get_skill_data
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator, the standard library parser is used otherwise
+    orjson = None
+
 CLASSES_DATA_PATH = "data/classes.json"
 
 
@@ -46,14 +53,29 @@ class ClassEntry(TypedDict):
     stats_up: StatsUp
 
 
+# classes.json does not change while the game runs, so it is only parsed once
+@functools.cache
 def load_classes() -> dict[str, ClassEntry]:
     """Load, normalize and return the class data structure.
 
     Returns a mapping ``class_name -> ClassEntry`` with guaranteed presence of
     the optional keys (defaulted if absent) and converted skill objects.
+    The result is memoized: later calls return the same mapping.
     """
-    with open(CLASSES_DATA_PATH, "r", encoding="utf-8") as file:
-        classes: dict[str, ClassEntry] = json.load(file)
+    raw_data = Path(CLASSES_DATA_PATH).read_bytes()
+    classes: dict[str, ClassEntry] = (
+        orjson.loads(raw_data) if orjson is not None else json.loads(raw_data)
+    )
+
+    # Resolve each distinct skill once, however many classes share it.
+    resolved_skills: dict[str, Skill] = {
+        skill_name: get_skill_data(skill_name)
+        for skill_name in {
+            skill_name
+            for _class in classes.values()
+            for skill_name in _class.get("skills", ())
+        }
+    }
 
     for _class in classes.values():
         # Inject missing numeric defaults.
@@ -69,7 +91,7 @@ def load_classes() -> dict[str, ClassEntry]:
 
         # Replace skill name strings by Skill instances.
         _class["skills"] = [
-            get_skill_data(skill_name) for skill_name in _class.get("skills", ())
+            resolved_skills[skill_name] for skill_name in _class.get("skills", ())
         ]
 
     return classes
\ No newline at end of file
@@ -0,0 +1,121 @@
+import unittest
+from pathlib import Path
+
+import pygame as pg
+
+from apps.level_editor.metadata import apply_metadata
+from apps.level_editor.palette_model import (
+    CategorySpec,
+    PaletteModel,
+    TilesetIndex,
+    animated_filter,
+    property_filter,
+)
+from apps.level_editor.tileset_loader import TileEntry, TilesetData, TilesetInfo
+
+
+def build_tileset(name, tile_count, properties):
+    info = TilesetInfo(
+        name=name,
+        path=Path(f"{name}.tsx"),
+        image_path=None,
+        tile_width=16,
+        tile_height=16,
+        margin=0,
+        spacing=0,
+        columns=tile_count,
+        tile_count=tile_count,
+    )
+    tiles = [
+        TileEntry(
+            tileset_name=name,
+            local_id=local_id,
+            properties=dict(properties.get(local_id, {})),
+            image=pg.Surface((16, 16)),
+        )
+        for local_id in range(tile_count)
+    ]
+    return TilesetData(info=info, tiles=tiles)
+
+
+class TestPaletteModel(unittest.TestCase):
+    def setUp(self):
+        self.tilesets = {"a": build_tileset("a", 10, {1: {"solid": "1"}, 4: {"solid": "0"}})}
+        self.model = PaletteModel(self.tilesets)
+        self.model.set_tileset("a")
+
+    def active_ids(self):
+        return [tile.local_id for tile in self.model.active_tiles]
+
+    def test_indexed_filter_matches_predicate(self):
+        self.model.set_filter_indexed("solid")
+        indexed = self.active_ids()
+        self.model.set_filter(property_filter("solid"))
+        self.assertEqual([1, 4], indexed)
+        self.assertEqual(indexed, self.active_ids())
+
+        self.model.set_filter_indexed("solid", "1")
+        self.assertEqual([1], self.active_ids())
+
+    def test_indexed_filter_after_metadata(self):
+        self.model.set_filter_indexed("solid")
+        self.assertEqual([1, 4], self.active_ids())
+
+        apply_metadata(self.tilesets, {"a": {"properties": {"7": {"solid": "1"}}}})
+
+        self.model.set_filter_indexed("solid")
+        self.assertEqual([1, 4, 7], self.active_ids())
+        self.model.set_filter(property_filter("solid"))
+        self.assertEqual([1, 4, 7], self.active_ids())
+
+    def test_animated_filter_after_tiles_change(self):
+        self.model.set_animated_filter()
+        self.assertEqual([], self.active_ids())
+
+        self.tilesets["a"].tiles[3].is_animated = True
+        self.tilesets["a"].mark_tiles_changed()
+
+        self.model.set_animated_filter()
+        indexed = self.active_ids()
+        self.model.set_filter(animated_filter())
+        self.assertEqual([3], indexed)
+        self.assertEqual(indexed, self.active_ids())
+
+    def test_category_filter_after_metadata(self):
+        apply_metadata(self.tilesets, {"a": {"categories": [{"name": "Wall", "ids": [2, 5]}]}})
+
+        self.model.set_category_filter("wall")
+        self.assertEqual([2, 5], self.active_ids())
+        self.assertEqual(("Wall",), self.tilesets["a"].categories)
+
+    def test_active_tiles_follow_metadata_without_refiltering(self):
+        self.model.set_filter_indexed("solid")
+        self.assertEqual([1, 4], self.active_ids())
+        version = self.model.version
+
+        apply_metadata(self.tilesets, {"a": {"properties": {"7": {"solid": "1"}}}})
+
+        self.assertNotEqual(version, self.model.version)
+        self.assertEqual([1, 4, 7], self.active_ids())
+        self.assertEqual([1, 4, 7], [tile.local_id for tile in self.model.page_tiles()])
+
+    def test_page_follows_metadata_without_reading_active_tiles(self):
+        self.model.set_filter_indexed("solid")
+        self.assertEqual([1, 4], [tile.local_id for tile in self.model.page_tiles()])
+        self.assertIsNone(self.model.page_position("a", 7))
+
+        apply_metadata(self.tilesets, {"a": {"properties": {"7": {"solid": "1"}}}})
+
+        self.assertEqual(2, self.model.page_position("a", 7))
+        self.assertEqual([1, 4, 7], [tile.local_id for tile in self.model.page_tiles()])
+
+    def test_index_rejects_category_spec(self):
+        index = TilesetIndex.build(self.tilesets["a"].tiles)
+        with self.assertRaises(ValueError):
+            index.lookup(CategorySpec(("wall",)))
+
+    def test_tile_entry_requires_a_surface_source(self):
+        with self.assertRaises(ValueError):
+            TileEntry(tileset_name="a", local_id=0, properties={})
+        with self.assertRaises(ValueError):
+            TileEntry(tileset_name="a", local_id=0, properties={}, atlas=pg.Surface((16, 16)))